@@ -26,11 +26,20 @@ type Client struct {
 	http *http.Client
 }
 
+// sharedTransport is http.DefaultTransport with a larger idle-per-host cap
+// (default 2). Every Client talks to the same cloud origin, so a burst of
+// mailer sends would otherwise close and redial connections past the second.
+var sharedTransport = func() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConnsPerHost = 8
+	return t
+}()
+
 // New builds a Client for the given API base URL (e.g. https://api.runespace.click).
 func New(baseURL string) *Client {
 	return &Client{
 		base: strings.TrimRight(baseURL, "/"),
-		http: &http.Client{Timeout: 30 * time.Second},
+		http: &http.Client{Timeout: 30 * time.Second, Transport: sharedTransport},
 	}
 }
 
@@ -125,12 +125,7 @@ func runDaemonStart(ctx context.Context) error {
 		ConsoleEndpoint: consoleEndpoint,
 	}
 
-	keyParams := crypto.KeysParams{
-		Root:  cfg.Keys.Path,
-		KeyID: "rune-console-key",
-		Dim:   cfg.Keys.EmbeddingDim,
-	}
-	if err := crypto.EnsureKeys(keyParams); err != nil {
+	if err := crypto.EnsureKeys(cfg.KeysParams()); err != nil {
 		return fmt.Errorf("daemon: ensure keys: %w", err)
 	}
 
@@ -171,7 +166,7 @@ func runDaemonStart(ctx context.Context) error {
 	slog.Info("console: starting daemon",
 		"pid", os.Getpid(),
 		"config", cfg.Source,
-		"grpc_addr", fmt.Sprintf("%s:%d", cfg.Server.GRPC.Host, cfg.Server.GRPC.Port),
+		"grpc_addr", cfg.GRPCAddr(),
 		"console_enabled", cfg.Server.Console.Enabled)
 
 	// Domain API handler (teams, users, memberships, invitations) — the design
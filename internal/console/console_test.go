@@ -126,6 +126,25 @@ func TestLoginStoreSingleUse(t *testing.T) {
 	}
 }
 
+func TestLoginStoreEvictsExpiredOnPut(t *testing.T) {
+	l := newLoginStore()
+	l.put("old", loginTx{created: time.Now().Add(-loginTTL - time.Minute)})
+	l.put("taken", loginTx{created: time.Now().Add(-loginTTL - time.Minute)})
+	if _, ok := l.take("taken"); !ok {
+		t.Fatal("take of a just-put state should succeed")
+	}
+	l.put("fresh", loginTx{created: time.Now()})
+	if _, ok := l.take("old"); ok {
+		t.Error("expired state survived a later put")
+	}
+	if _, ok := l.take("fresh"); !ok {
+		t.Error("fresh state was evicted")
+	}
+	if len(l.order) != 1 {
+		t.Errorf("order holds %d states, want only the fresh one", len(l.order))
+	}
+}
+
 // --- handler / middleware --------------------------------------------------
 
 func newTestHandler(t *testing.T) http.Handler {
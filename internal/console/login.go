@@ -24,22 +24,36 @@ type loginTx struct {
 
 // loginStore tracks in-flight handshakes (normally just one). Entries older
 // than 10 minutes are evicted on put (the cloud code TTL is ~60s).
+//
+// order records states in put order, so eviction pops expired entries off
+// the front and stops at the first live one instead of scanning every tx.
+// States already consumed by take are skipped as they reach the front.
 type loginStore struct {
-	mu  sync.Mutex
-	txs map[string]loginTx
+	mu    sync.Mutex
+	txs   map[string]loginTx
+	order []string
 }
 
+// loginTTL bounds how long an unfinished handshake is kept.
+const loginTTL = 10 * time.Minute
+
 func newLoginStore() *loginStore { return &loginStore{txs: map[string]loginTx{}} }
 
 func (l *loginStore) put(state string, tx loginTx) {
 	l.mu.Lock()
 	defer l.mu.Unlock()
-	for k, v := range l.txs {
-		if time.Since(v.created) > 10*time.Minute {
-			delete(l.txs, k)
+	for len(l.order) > 0 {
+		v, ok := l.txs[l.order[0]]
+		if ok && time.Since(v.created) <= loginTTL {
+			break
+		}
+		if ok {
+			delete(l.txs, l.order[0])
 		}
+		l.order = l.order[1:]
 	}
 	l.txs[state] = tx
+	l.order = append(l.order, state)
 }
 
 // take returns and removes the tx for state (single-use).
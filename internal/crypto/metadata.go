@@ -81,29 +81,54 @@ func EncryptMetadata(plaintext, key []byte) (string, error) {
 	if len(key) != dekLen {
 		return "", ErrInvalidKey
 	}
-	iv := make([]byte, ivLen)
-	if _, err := rand.Read(iv); err != nil {
-		return "", fmt.Errorf("crypto: read iv: %w", err)
-	}
 	block, err := aes.NewCipher(key)
 	if err != nil {
 		return "", err
 	}
-	ct := make([]byte, len(plaintext))
-	cipher.NewCTR(block, iv).XORKeyStream(ct, plaintext)
-	out := make([]byte, 0, ivLen+len(ct))
-	out = append(out, iv...)
-	out = append(out, ct...)
+	// IV and ciphertext are written straight into the one output buffer.
+	out := make([]byte, ivLen+len(plaintext))
+	iv := out[:ivLen]
+	if _, err := rand.Read(iv); err != nil {
+		return "", fmt.Errorf("crypto: read iv: %w", err)
+	}
+	cipher.NewCTR(block, iv).XORKeyStream(out[ivLen:], plaintext)
 	return base64.StdEncoding.EncodeToString(out), nil
 }
 
 // DecryptMetadata reverses EncryptMetadata: base64-decode the input, peel
 // off the 16-byte IV, then AES-256-CTR decrypt. Output is raw bytes; the
-// caller decides whether to UTF-8/JSON-parse them.
+// caller decides whether to UTF-8/JSON-parse them. Callers opening many
+// ciphertexts under one key should build a MetadataCipher once instead.
 func DecryptMetadata(ctB64 string, key []byte) ([]byte, error) {
+	c, err := NewMetadataCipher(key)
+	if err != nil {
+		return nil, err
+	}
+	return c.Decrypt(ctB64)
+}
+
+// MetadataCipher holds one DEK's expanded AES-256 key schedule so a batch of
+// metadata ciphertexts sealed under the same key pays the key expansion once.
+// It is safe for concurrent use: the block cipher is read-only after
+// construction and each Decrypt builds its own CTR stream.
+type MetadataCipher struct {
+	block cipher.Block
+}
+
+// NewMetadataCipher expands key (a 32-byte DEK) for repeated Decrypt calls.
+func NewMetadataCipher(key []byte) (*MetadataCipher, error) {
 	if len(key) != dekLen {
 		return nil, ErrInvalidKey
 	}
+	block, err := aes.NewCipher(key)
+	if err != nil {
+		return nil, err
+	}
+	return &MetadataCipher{block: block}, nil
+}
+
+// Decrypt opens one EncryptMetadata ciphertext; see DecryptMetadata.
+func (c *MetadataCipher) Decrypt(ctB64 string) ([]byte, error) {
 	raw, err := base64.StdEncoding.DecodeString(ctB64)
 	if err != nil {
 		return nil, fmt.Errorf("crypto: base64 decode: %w", err)
@@ -111,13 +136,9 @@ func DecryptMetadata(ctB64 string, key []byte) ([]byte, error) {
 	if len(raw) < ivLen {
 		return nil, ErrInvalidCiphertext
 	}
-	iv := raw[:ivLen]
-	ct := raw[ivLen:]
-	block, err := aes.NewCipher(key)
-	if err != nil {
-		return nil, err
-	}
-	pt := make([]byte, len(ct))
-	cipher.NewCTR(block, iv).XORKeyStream(pt, ct)
+	// CTR decrypts in place: the plaintext overwrites the ciphertext within
+	// the decoded buffer, so the only allocation is the base64 decode.
+	pt := raw[ivLen:]
+	cipher.NewCTR(c.block, raw[:ivLen]).XORKeyStream(pt, pt)
 	return pt, nil
 }
@@ -175,6 +175,29 @@ func TestDecryptGoldenBytes(t *testing.T) {
 	}
 }
 
+func TestMetadataCipherReusedAcrossGoldens(t *testing.T) {
+	key, _ := DeriveAgentKey(goldenTeamSecret, goldenAgentID)
+	c, err := NewMetadataCipher(key)
+	if err != nil {
+		t.Fatal(err)
+	}
+	for ct, want := range map[string]string{
+		"OhawM+14dWV/2KJwL0Ud3pqJpP6Mr7XVfCsM":             "hello world",
+		"x801QtEfmRM9Hg9ncV0p1aHbcPTBGI/63+L7c/TPVoPFRS/p": `{"foo":"bar","n":42}`,
+	} {
+		got, err := c.Decrypt(ct)
+		if err != nil {
+			t.Fatal(err)
+		}
+		if string(got) != want {
+			t.Errorf("Decrypt(%s) = %q, want %q", ct, got, want)
+		}
+	}
+	if _, err := NewMetadataCipher([]byte("short")); err != ErrInvalidKey {
+		t.Errorf("NewMetadataCipher(short) err = %v, want ErrInvalidKey", err)
+	}
+}
+
 // ── error cases ──────────────────────────────────────────────────
 
 func TestDecryptInvalidKey(t *testing.T) {
@@ -6,7 +6,7 @@ import (
 	"database/sql"
 	"encoding/hex"
 	"fmt"
-	"os"
+	"log/slog"
 	"sync"
 	"time"
 
@@ -257,7 +257,7 @@ func (s *Store) Unwrap(handle string) (token, memberID string, err error) {
 			}); perr != nil {
 				// The refusal stands regardless; the flip is retried on the
 				// next access (or by the sweep in any later write).
-				fmt.Fprintf(os.Stderr, "invites: persist age-out flip failed: %v\n", perr)
+				slog.Warn("invites: persist age-out flip failed", "err", perr)
 				return "", "", gErr
 			}
 			inv.Status = StatusExpired
@@ -9,6 +9,7 @@ import (
 	"path/filepath"
 	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"google.golang.org/grpc/peer"
@@ -57,12 +58,35 @@ type AuditEntry struct {
 }
 
 // AuditLogger writes structured audit entries. Closed loggers are no-ops.
+//
+// Log only encodes the entry and hands it to a background writer, so an RPC
+// never waits on the sink's disk write; the writer coalesces whatever has
+// queued up into one Write per sink. Close drains the queue before closing
+// the sinks, so no accepted entry is lost on shutdown.
 type AuditLogger struct {
-	mu      sync.Mutex
-	writers []io.Writer
+	// enabled mirrors len(writers) > 0 so the per-RPC Enabled/Log gate is a
+	// lock-free load.
+	enabled atomic.Bool
+
+	// mu orders Log's enqueue (read side) against Close (write side) so no
+	// send ever races the channel close.
+	mu     sync.RWMutex
+	closed bool
+	queue  chan []byte
+	done   chan struct{}
+
+	writers []io.Writer // owned by the writer goroutine once started
 	closers []io.Closer
 }
 
+const (
+	// auditQueueLen bounds how many encoded entries may wait for the writer;
+	// beyond it Log blocks rather than drop an audit record.
+	auditQueueLen = 1024
+	// auditBatchBytes caps how much the writer coalesces into one Write.
+	auditBatchBytes = 64 << 10
+)
+
 // NewAuditLogger constructs a logger for the given mode + file path.
 // Returns a logger with Enabled() == false when the mode is empty.
 func NewAuditLogger(cfg AuditConfig) (*AuditLogger, error) {
@@ -95,17 +119,46 @@ func NewAuditLogger(cfg AuditConfig) (*AuditLogger, error) {
 	if mode.Stdout {
 		l.writers = append(l.writers, os.Stdout)
 	}
+	if len(l.writers) > 0 {
+		l.queue = make(chan []byte, auditQueueLen)
+		l.done = make(chan struct{})
+		go l.run()
+		l.enabled.Store(true)
+	}
 	return l, nil
 }
 
+// run is the writer goroutine: it drains the queue in arrival order until
+// Close closes it.
+func (a *AuditLogger) run() {
+	defer close(a.done)
+	var batch []byte
+	for buf := range a.queue {
+		batch = append(batch[:0], buf...)
+	coalesce:
+		for len(batch) < auditBatchBytes {
+			select {
+			case more, ok := <-a.queue:
+				if !ok {
+					break coalesce
+				}
+				batch = append(batch, more...)
+			default:
+				break coalesce
+			}
+		}
+		for _, w := range a.writers {
+			_, _ = w.Write(batch)
+		}
+	}
+}
+
 // Enabled reports whether at least one sink is configured.
 func (a *AuditLogger) Enabled() bool {
 	if a == nil {
 		return false
 	}
-	a.mu.Lock()
-	defer a.mu.Unlock()
-	return len(a.writers) > 0
+	return a.enabled.Load()
 }
 
 // Log emits a single audit entry. Round-trip latency is rounded to 2dp.
@@ -121,20 +174,32 @@ func (a *AuditLogger) Log(e AuditEntry) {
 	}
 	buf = append(buf, '\n')
 
-	a.mu.Lock()
-	defer a.mu.Unlock()
-	for _, w := range a.writers {
-		_, _ = w.Write(buf)
+	a.mu.RLock()
+	defer a.mu.RUnlock()
+	if a.closed {
+		return
 	}
+	a.queue <- buf
 }
 
-// Close flushes file writers and prevents future Log calls from writing.
+// Close drains queued entries to the sinks, closes file writers, and prevents
+// future Log calls from writing. Safe to call more than once.
 func (a *AuditLogger) Close() error {
 	if a == nil {
 		return nil
 	}
 	a.mu.Lock()
-	defer a.mu.Unlock()
+	if a.closed {
+		a.mu.Unlock()
+		return nil
+	}
+	a.closed = true
+	a.enabled.Store(false)
+	a.mu.Unlock()
+	if a.queue != nil {
+		close(a.queue)
+		<-a.done
+	}
 	var firstErr error
 	for _, c := range a.closers {
 		if err := c.Close(); err != nil && firstErr == nil {
@@ -180,5 +245,10 @@ func ExtractSourceIP(p *peer.Peer) string {
 }
 
 func nowUTCISO() string {
-	return time.Now().UTC().Format("2006-01-02T15:04:05.000000Z07:00")
+	return formatUTCISO(time.Now())
+}
+
+// formatUTCISO renders t in the audit timestamp layout (UTC, microseconds).
+func formatUTCISO(t time.Time) string {
+	return t.UTC().Format("2006-01-02T15:04:05.000000Z07:00")
 }
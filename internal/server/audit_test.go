@@ -98,6 +98,44 @@ func TestAuditLoggerFileMode(t *testing.T) {
 	}
 }
 
+// TestAuditLoggerCloseDrainsQueue: entries handed to the background writer
+// all reach the file, in Log order, by the time Close returns.
+func TestAuditLoggerCloseDrainsQueue(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "audit.log")
+	l, err := NewAuditLogger(AuditConfig{Mode: "file", Path: path})
+	if err != nil {
+		t.Fatal(err)
+	}
+	const n = 3 * auditQueueLen
+	for i := 0; i < n; i++ {
+		l.Log(AuditEntry{UserID: "alice", ResultCount: i})
+	}
+	if err := l.Close(); err != nil {
+		t.Fatal(err)
+	}
+	l.Log(AuditEntry{UserID: "after-close"})
+
+	f, err := os.Open(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer f.Close()
+	scanner := bufio.NewScanner(f)
+	i := 0
+	for ; scanner.Scan(); i++ {
+		var got AuditEntry
+		if err := json.Unmarshal(scanner.Bytes(), &got); err != nil {
+			t.Fatal(err)
+		}
+		if got.ResultCount != i || got.UserID != "alice" {
+			t.Fatalf("line %d = %+v, want result_count %d from alice", i, got, i)
+		}
+	}
+	if i != n {
+		t.Errorf("got %d lines, want %d", i, n)
+	}
+}
+
 func TestAuditLoggerOmitsErrorWhenNil(t *testing.T) {
 	dir := t.TempDir()
 	path := filepath.Join(dir, "audit.log")
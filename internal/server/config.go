@@ -7,12 +7,16 @@ import (
 	"errors"
 	"fmt"
 	"io/fs"
+	"net"
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
 	"time"
 
 	"gopkg.in/yaml.v3"
+
+	"github.com/CryptoLabInc/rune-console/internal/crypto"
 )
 
 // ConfigLookupPaths lists, in priority order, the on-disk locations that
@@ -62,6 +66,10 @@ type GRPCConfig struct {
 	Host string    `yaml:"host"`
 	Port int       `yaml:"port"`
 	TLS  TLSConfig `yaml:"tls"`
+	// MaxConcurrentSearches caps how many Search calls may be in flight to
+	// the engine at once; excess callers queue until their deadline. 0 (the
+	// default) leaves Search unbounded.
+	MaxConcurrentSearches int `yaml:"max_concurrent_searches"`
 }
 
 type TLSConfig struct {
@@ -102,6 +110,26 @@ func (c *Config) ConsolePort() int {
 	return c.Server.Console.Port
 }
 
+// GRPCAddr returns the gRPC listen address, host defaulting to 0.0.0.0.
+// JoinHostPort brackets an IPv6 host so the result always parses back.
+func (c *Config) GRPCAddr() string {
+	return net.JoinHostPort(grpcHost(c), strconv.Itoa(c.Server.GRPC.Port))
+}
+
+// consoleKeyID names the console's key set under Keys.Path.
+const consoleKeyID = "rune-console-key"
+
+// KeysParams returns the on-disk key bundle the console generates at boot
+// and serves to agents. The daemon's EnsureKeys and the manifest handler
+// both go through here so they can never disagree on which bundle exists.
+func (c *Config) KeysParams() crypto.KeysParams {
+	return crypto.KeysParams{
+		Root:  c.Keys.Path,
+		KeyID: consoleKeyID,
+		Dim:   c.Keys.EmbeddingDim,
+	}
+}
+
 // ConsoleDBPath returns the session-store path, defaulting into the data
 // directory.
 func (c *Config) ConsoleDBPath() string {
@@ -254,6 +282,14 @@ func (c *Config) Validate() error {
 	var errs []string
 	if c.Server.GRPC.Port == 0 {
 		errs = append(errs, "server.grpc.port is required")
+	} else if c.Server.GRPC.Port < 0 || c.Server.GRPC.Port > 65535 {
+		errs = append(errs, fmt.Sprintf("server.grpc.port %d is out of range (1-65535)", c.Server.GRPC.Port))
+	}
+	if c.Server.Console.Port < 0 || c.Server.Console.Port > 65535 {
+		errs = append(errs, fmt.Sprintf("server.console.port %d is out of range (1-65535)", c.Server.Console.Port))
+	}
+	if c.Server.GRPC.MaxConcurrentSearches < 0 {
+		errs = append(errs, fmt.Sprintf("server.grpc.max_concurrent_searches %d must not be negative", c.Server.GRPC.MaxConcurrentSearches))
 	}
 	if c.Server.Console.Enabled && c.Cloud.APIBaseURL == "" {
 		errs = append(errs, "cloud.api_base_url is required when server.console.enabled")
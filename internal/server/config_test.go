@@ -184,10 +184,11 @@ func TestRedactMasksSecrets(t *testing.T) {
 
 func TestValidateRejectsMissingFields(t *testing.T) {
 	cases := map[string]func(*Config){
-		"missing port":      func(c *Config) { c.Server.GRPC.Port = 0 },
-		"missing keys.path": func(c *Config) { c.Keys.Path = "" },
-		"missing dim":       func(c *Config) { c.Keys.EmbeddingDim = 0 },
-		"missing data_dir":  func(c *Config) { c.Storage.DataDir = "" },
+		"missing port":        func(c *Config) { c.Server.GRPC.Port = 0 },
+		"missing keys.path":   func(c *Config) { c.Keys.Path = "" },
+		"missing dim":         func(c *Config) { c.Keys.EmbeddingDim = 0 },
+		"missing data_dir":    func(c *Config) { c.Storage.DataDir = "" },
+		"negative search cap": func(c *Config) { c.Server.GRPC.MaxConcurrentSearches = -1 },
 	}
 	base := func() *Config {
 		path := writeConfig(t, minimalValidConfig(t))
@@ -260,3 +261,42 @@ func TestStoreDBPathDefaultsIntoDataDir(t *testing.T) {
 		t.Errorf("StoreDBPath = %q, want %q", got, want)
 	}
 }
+
+func TestValidateRejectsOutOfRangePorts(t *testing.T) {
+	cases := map[string]func(*Config){
+		"grpc port too high":    func(c *Config) { c.Server.GRPC.Port = 65536 },
+		"grpc port negative":    func(c *Config) { c.Server.GRPC.Port = -1 },
+		"console port too high": func(c *Config) { c.Server.Console.Port = 70000 },
+	}
+	for name, mut := range cases {
+		t.Run(name, func(t *testing.T) {
+			c, err := LoadConfig(writeConfig(t, minimalValidConfig(t)))
+			if err != nil {
+				t.Fatal(err)
+			}
+			mut(c)
+			if err := c.Validate(); err == nil || !strings.Contains(err.Error(), "out of range") {
+				t.Errorf("Validate(%s) = %v, want out-of-range error", name, err)
+			}
+		})
+	}
+}
+
+func TestGRPCAddrJoinsHostAndPort(t *testing.T) {
+	cases := []struct {
+		host string
+		want string
+	}{
+		{"", "0.0.0.0:50051"},
+		{"127.0.0.1", "127.0.0.1:50051"},
+		{"::1", "[::1]:50051"},
+	}
+	for _, tc := range cases {
+		c := &Config{}
+		c.Server.GRPC.Host = tc.host
+		c.Server.GRPC.Port = 50051
+		if got := c.GRPCAddr(); got != tc.want {
+			t.Errorf("GRPCAddr(host=%q) = %q, want %q", tc.host, got, tc.want)
+		}
+	}
+}
@@ -6,6 +6,7 @@ import (
 	"encoding/json"
 	"errors"
 	"fmt"
+	"strings"
 	"sync"
 	"time"
 
@@ -96,20 +97,41 @@ type Console struct {
 	memberAct    memberActivator
 
 	bundleParams crypto.KeysParams
+
+	// encKeys caches the PUBLIC RMP/MM EncKey envelopes the manifest carries.
+	// The key set is generated once at boot (EnsureKeys never overwrites), so
+	// after the first successful read GetAgentManifest serves them from
+	// memory instead of re-reading both files per call. Guarded by encKeysMu;
+	// a failed read is not cached, so the next call retries.
+	encKeysMu sync.Mutex
+	encKeys   *encKeyPair
+
+	// metaCiphers caches each authoring agent's ready metadata cipher (HKDF
+	// derivation + AES key expansion) across Search calls; the team secret
+	// is fixed for the process, so an entry never goes stale. Bounded by
+	// maxMetaCiphers and simply dropped wholesale when full. Guarded by
+	// metaCiphersMu.
+	metaCiphersMu sync.Mutex
+	metaCiphers   map[string]*crypto.MetadataCipher
+
+	// searchSlots bounds how many Search calls run against the engine at
+	// once (server.grpc.max_concurrent_searches); excess callers queue here,
+	// honoring their deadline. nil when the limit is unset: Search is then
+	// unbounded.
+	searchSlots chan struct{}
 }
 
 // NewConsole wires all subsystems together. Caller is responsible for Close.
 func NewConsole(cfg *Config, tokenStore *tokens.Store, groupStore *groups.Store, engine *crypto.Engine, audit *AuditLogger) *Console {
 	v := &Console{
-		cfg:    cfg,
-		tokens: tokenStore,
-		groups: groupStore,
-		audit:  audit,
-		bundleParams: crypto.KeysParams{
-			Root:  cfg.Keys.Path,
-			KeyID: defaultKeyID(cfg),
-			Dim:   cfg.Keys.EmbeddingDim,
-		},
+		cfg:          cfg,
+		tokens:       tokenStore,
+		groups:       groupStore,
+		audit:        audit,
+		bundleParams: cfg.KeysParams(),
+	}
+	if n := cfg.Server.GRPC.MaxConcurrentSearches; n > 0 {
+		v.searchSlots = make(chan struct{}, n)
 	}
 	// Guard the assignment so a nil *crypto.Engine stays a nil interface: a
 	// typed-nil stored in the consoleEngine field would defeat the `engine == nil`
@@ -120,8 +142,6 @@ func NewConsole(cfg *Config, tokenStore *tokens.Store, groupStore *groups.Store,
 	return v
 }
 
-func defaultKeyID(_ *Config) string { return "rune-console-key" }
-
 // getEngine returns the connected runespace engine, or (nil, false) when the
 // data plane is not connected yet. Handlers must go through this — the engine
 // can be connected/closed concurrently with serving.
@@ -411,25 +431,22 @@ type envelope struct {
 // ── GetAgentManifest (config only — no keys ever leave the console) ──
 
 func (s *ConsoleGRPC) GetAgentManifest(ctx context.Context, req *pb.GetAgentManifestRequest) (*pb.GetAgentManifestResponse, error) {
-	start := time.Now()
-	user := s.v.tokens.GetUsername(req.GetToken())
-	if user == "" {
-		user = "unknown"
-	}
+	start := s.auditStart()
+	user := "unknown"
 	resultCount := 0
 	statusStr := "success"
 	var errDetail *string
 	defer func() {
-		s.emit(ctx, "get_agent_manifest", user, nil, resultCount, statusStr, errDetail, time.Since(start))
+		s.emit(ctx, "get_agent_manifest", user, nil, resultCount, statusStr, errDetail, start)
 	}()
 
 	username, err := s.v.tokens.Validate(req.GetToken())
+	user = auditUser(username, err)
 	if err != nil {
 		st, msg := mapTokenError(err)
 		statusStr, errDetail = errStatus(err)
 		return &pb.GetAgentManifestResponse{Error: msg}, status.Error(st, msg)
 	}
-	user = username
 	if _, _, err := s.v.resolveMemberAccess(username); err != nil {
 		statusStr = "denied"
 		ed := err.Error()
@@ -464,24 +481,21 @@ func (s *ConsoleGRPC) GetAgentManifest(ctx context.Context, req *pb.GetAgentMani
 // (e.g. GetAgentManifest) is not enough, since the agent can still be
 // mid-configure. Any valid token may report its own activation; idempotent.
 func (s *ConsoleGRPC) ReportActivation(ctx context.Context, req *pb.ReportActivationRequest) (*pb.ReportActivationResponse, error) {
-	start := time.Now()
-	user := s.v.tokens.GetUsername(req.GetToken())
-	if user == "" {
-		user = "unknown"
-	}
+	start := s.auditStart()
+	user := "unknown"
 	statusStr := "success"
 	var errDetail *string
 	defer func() {
-		s.emit(ctx, "report_activation", user, nil, 0, statusStr, errDetail, time.Since(start))
+		s.emit(ctx, "report_activation", user, nil, 0, statusStr, errDetail, start)
 	}()
 
 	username, err := s.v.tokens.Validate(req.GetToken())
+	user = auditUser(username, err)
 	if err != nil {
 		st, msg := mapTokenError(err)
 		statusStr, errDetail = errStatus(err)
 		return nil, status.Error(st, msg)
 	}
-	user = username
 	if err := s.v.tokens.MarkActivated(user); err != nil {
 		statusStr = "error"
 		ed := err.Error()
@@ -491,16 +505,62 @@ func (s *ConsoleGRPC) ReportActivation(ctx context.Context, req *pb.ReportActiva
 	return &pb.ReportActivationResponse{}, nil
 }
 
+// agentManifest is the GetAgentManifest JSON document. A typed struct instead
+// of a map[string]any spares the per-call map build and the encoder's key
+// sort; fields are declared in the alphabetical order the map encoding used,
+// so the wire bytes are unchanged.
+type agentManifest struct {
+	AgentDEK           string          `json:"agent_dek"`
+	AgentID            string          `json:"agent_id"`
+	CentroidSetVersion *string         `json:"centroid_set_version,omitempty"` // nil = engine not connected / no set
+	Dim                int             `json:"dim"`
+	KeyID              string          `json:"key_id"`
+	MMEncKey           json.RawMessage `json:"mm_enc_key"`  // MM (clustered) EncKey envelope, pre-encoded JSON string
+	RMPEncKey          json.RawMessage `json:"rmp_enc_key"` // RMP (flat) EncKey envelope, pre-encoded JSON string
+}
+
+// encKeyPair is the cached RMP + MM EncKey envelope pair. Each envelope is
+// held already encoded as a JSON string literal: the envelopes are the bulk
+// of the manifest, so escaping them once here keeps every GetAgentManifest
+// from re-quoting the same key material.
+type encKeyPair struct {
+	rmp, mm json.RawMessage
+}
+
+// loadEncKeys returns the EncKey envelopes, reading them from disk only until
+// the first read succeeds.
+func (v *Console) loadEncKeys() (*encKeyPair, error) {
+	v.encKeysMu.Lock()
+	defer v.encKeysMu.Unlock()
+	if v.encKeys != nil {
+		return v.encKeys, nil
+	}
+	rmp, err := crypto.ReadRMPEncKey(v.bundleParams)
+	if err != nil {
+		return nil, err
+	}
+	mm, err := crypto.ReadMMEncKey(v.bundleParams)
+	if err != nil {
+		return nil, err
+	}
+	rmpJSON, err := json.Marshal(rmp)
+	if err != nil {
+		return nil, err
+	}
+	mmJSON, err := json.Marshal(mm)
+	if err != nil {
+		return nil, err
+	}
+	v.encKeys = &encKeyPair{rmp: rmpJSON, mm: mmJSON}
+	return v.encKeys, nil
+}
+
 // buildBundle assembles the per-token agent manifest returned by
 // GetAgentManifest: the PUBLIC EncKey pair (RMP + MM EncKey.json envelopes) and
 // the caller's derived agent_dek so rune-mcp can encrypt + seal locally, plus
 // the config and the cheap centroid-set version pointer. SecKey never leaves.
-func (v *Console) buildBundle(ctx context.Context, token string) (map[string]any, error) {
-	rmpEnc, err := crypto.ReadRMPEncKey(v.bundleParams)
-	if err != nil {
-		return nil, err
-	}
-	mmEnc, err := crypto.ReadMMEncKey(v.bundleParams)
+func (v *Console) buildBundle(ctx context.Context, token string) (*agentManifest, error) {
+	keys, err := v.loadEncKeys()
 	if err != nil {
 		return nil, err
 	}
@@ -509,20 +569,20 @@ func (v *Console) buildBundle(ctx context.Context, token string) (map[string]any
 	if err != nil {
 		return nil, err
 	}
-	bundle := map[string]any{
-		"key_id":      v.bundleParams.KeyID,
-		"agent_id":    agentID,
-		"dim":         v.cfg.Keys.EmbeddingDim,
-		"rmp_enc_key": rmpEnc, // RMP (flat) EncKey envelope, verbatim JSON
-		"mm_enc_key":  mmEnc,  // MM (clustered) EncKey envelope, verbatim JSON
-		"agent_dek":   base64.StdEncoding.EncodeToString(dek),
+	bundle := &agentManifest{
+		KeyID:     v.bundleParams.KeyID,
+		AgentID:   agentID,
+		Dim:       v.cfg.Keys.EmbeddingDim,
+		RMPEncKey: keys.rmp,
+		MMEncKey:  keys.mm,
+		AgentDEK:  base64.StdEncoding.EncodeToString(dek),
 	}
 	// Cheap centroid-set version pointer: rune-mcp skips the heavy GetCentroids
-	// fetch when its cache already matches. Best-effort — empty ("none loaded
+	// fetch when its cache already matches. Best-effort — omitted ("none loaded
 	// yet") when the engine is not connected or has no centroid set.
 	if eng, ok := v.getEngine(); ok {
 		if cs, cerr := eng.Centroids(ctx); cerr == nil {
-			bundle["centroid_set_version"] = cs.Version
+			bundle.CentroidSetVersion = &cs.Version
 		}
 	}
 	return bundle, nil
@@ -535,12 +595,12 @@ func (v *Console) buildBundle(ctx context.Context, token string) (map[string]any
 // reconnect over TLS. Pre-auth, engine-independent (interceptor exempts it):
 // it is a public certificate carrying no secret.
 func (s *ConsoleGRPC) GetCACert(ctx context.Context, _ *pb.GetCACertRequest) (*pb.GetCACertResponse, error) {
-	start := time.Now()
+	start := s.auditStart()
 	resultCount := 0
 	statusStr := "success"
 	var errDetail *string
 	defer func() {
-		s.emit(ctx, "get_ca_cert", "bootstrap", nil, resultCount, statusStr, errDetail, time.Since(start))
+		s.emit(ctx, "get_ca_cert", "bootstrap", nil, resultCount, statusStr, errDetail, start)
 	}()
 
 	pem, pin, err := caPEMAndPin(s.v.cfg)
@@ -556,27 +616,24 @@ func (s *ConsoleGRPC) GetCACert(ctx context.Context, _ *pb.GetCACertRequest) (*p
 // ── Insert (capture write) ────────────────────────────────────────
 
 func (s *ConsoleGRPC) Insert(ctx context.Context, req *pb.InsertRequest) (*pb.InsertResponse, error) {
-	start := time.Now()
-	user := s.v.tokens.GetUsername(req.GetToken())
-	if user == "" {
-		user = "unknown"
-	}
+	start := s.auditStart()
+	user := "unknown"
 	resultCount := 0
 	statusStr := "success"
 	var errDetail *string
 	defer func() {
-		s.emit(ctx, "insert", user, nil, resultCount, statusStr, errDetail, time.Since(start))
+		s.emit(ctx, "insert", user, nil, resultCount, statusStr, errDetail, start)
 	}()
 
 	// Validate authenticates identity only; the group RBAC judge gates capture
 	// (plan §6-D3 single judge).
 	username, err := s.v.tokens.Validate(req.GetToken())
+	user = auditUser(username, err)
 	if err != nil {
 		st, msg := mapTokenError(err)
 		statusStr, errDetail = errStatus(err)
 		return &pb.InsertResponse{Error: msg}, status.Error(st, msg)
 	}
-	user = username
 	key, _, err := s.v.resolveMemberAccess(username)
 	if err != nil {
 		statusStr = "denied"
@@ -641,25 +698,22 @@ const centroidBatchSize = 256
 // caches it and assigns each vector's cluster locally before encrypting.
 func (s *ConsoleGRPC) GetCentroids(req *pb.GetCentroidsRequest, stream pb.ConsoleService_GetCentroidsServer) error {
 	ctx := stream.Context()
-	start := time.Now()
-	user := s.v.tokens.GetUsername(req.GetToken())
-	if user == "" {
-		user = "unknown"
-	}
+	start := s.auditStart()
+	user := "unknown"
 	resultCount := 0
 	statusStr := "success"
 	var errDetail *string
 	defer func() {
-		s.emit(ctx, "get_centroids", user, nil, resultCount, statusStr, errDetail, time.Since(start))
+		s.emit(ctx, "get_centroids", user, nil, resultCount, statusStr, errDetail, start)
 	}()
 
 	username, err := s.v.tokens.Validate(req.GetToken())
+	user = auditUser(username, err)
 	if err != nil {
 		st, msg := mapTokenError(err)
 		statusStr, errDetail = errStatus(err)
 		return status.Error(st, msg)
 	}
-	user = username
 
 	eng, ok := s.v.getEngine()
 	if !ok {
@@ -689,15 +743,24 @@ func (s *ConsoleGRPC) GetCentroids(req *pb.GetCentroidsRequest, stream pb.Consol
 		return err
 	}
 
+	// Every Centroid message and the pointer slice the batches are cut from
+	// come from two up-front allocations rather than one per vector. The
+	// messages are not reused across Sends — grpc may still hold a sent
+	// message — each frame just references its own window of the backing
+	// arrays.
+	cents := make([]pb.Centroid, len(cs.Vectors))
+	ptrs := make([]*pb.Centroid, len(cs.Vectors))
+	for i, v := range cs.Vectors {
+		cents[i].Id = uint32(i)
+		cents[i].Vec = v
+		ptrs[i] = &cents[i]
+	}
 	for i := 0; i < len(cs.Vectors); i += centroidBatchSize {
 		end := i + centroidBatchSize
 		if end > len(cs.Vectors) {
 			end = len(cs.Vectors)
 		}
-		batch := make([]*pb.Centroid, 0, end-i)
-		for j, v := range cs.Vectors[i:end] {
-			batch = append(batch, &pb.Centroid{Id: uint32(i + j), Vec: v})
-		}
+		batch := ptrs[i:end:end]
 		if err := stream.Send(&pb.CentroidChunk{Payload: &pb.CentroidChunk_Batch{Batch: &pb.CentroidBatch{Centroids: batch}}}); err != nil {
 			statusStr = "error"
 			msg := err.Error()
@@ -712,29 +775,39 @@ func (s *ConsoleGRPC) GetCentroids(req *pb.GetCentroidsRequest, stream pb.Consol
 // ── Search (recall + novelty) ─────────────────────────────────────
 
 func (s *ConsoleGRPC) Search(ctx context.Context, req *pb.SearchRequest) (*pb.SearchResponse, error) {
-	start := time.Now()
+	start := s.auditStart()
 	topK := req.GetTopK()
-	user := s.v.tokens.GetUsername(req.GetToken())
-	if user == "" {
-		user = "unknown"
-	}
+	user := "unknown"
 	resultCount := 0
 	statusStr := "success"
 	var errDetail *string
 	defer func() {
-		s.emit(ctx, "search", user, &topK, resultCount, statusStr, errDetail, time.Since(start))
+		s.emit(ctx, "search", user, &topK, resultCount, statusStr, errDetail, start)
 	}()
 
+	// The .proto only floors the query length (min_items = 1; top_k is capped
+	// at 300 there). The handler adds the equality rule: a query whose length
+	// is not the configured embedding dim cannot be scored against the index.
+	// It is a shape check against config that is not secret (every agent's
+	// manifest carries dim), so it runs before token validation and malformed
+	// traffic is refused without touching the token store or the engine.
+	if dim := s.v.cfg.Keys.EmbeddingDim; dim > 0 && len(req.GetVector()) != dim {
+		statusStr = "error"
+		msg := fmt.Sprintf("query vector has %d dimensions, want %d", len(req.GetVector()), dim)
+		errDetail = &msg
+		return &pb.SearchResponse{Error: msg}, status.Error(codes.InvalidArgument, msg)
+	}
+
 	// Validate authenticates identity only; recall itself is open to any valid
 	// token (read is the lowest role). What the caller SEES is bounded by their
 	// recall scope, computed below (plan §6-D3 single judge).
 	username, err := s.v.tokens.Validate(req.GetToken())
+	user = auditUser(username, err)
 	if err != nil {
 		st, msg := mapTokenError(err)
 		statusStr, errDetail = errStatus(err)
 		return &pb.SearchResponse{Error: msg}, status.Error(st, msg)
 	}
-	user = username
 	key, _, err := s.v.resolveMemberAccess(username)
 	if err != nil {
 		statusStr = "denied"
@@ -765,6 +838,17 @@ func (s *ConsoleGRPC) Search(ctx context.Context, req *pb.SearchRequest) (*pb.Se
 	if len(scope) == 0 {
 		scope = []string{publicOnlyScopeSentinel}
 	}
+	if slots := s.v.searchSlots; slots != nil {
+		select {
+		case slots <- struct{}{}:
+			defer func() { <-slots }()
+		case <-ctx.Done():
+			statusStr = "error"
+			msg := ctx.Err().Error()
+			errDetail = &msg
+			return &pb.SearchResponse{Error: msg}, status.FromContextError(ctx.Err()).Err()
+		}
+	}
 	hits, err := eng.Search(ctx, req.GetVector(), int(topK), scope...)
 	if err != nil {
 		statusStr = "error"
@@ -772,36 +856,45 @@ func (s *ConsoleGRPC) Search(ctx context.Context, req *pb.SearchRequest) (*pb.Se
 		errDetail = &msg
 		return &pb.SearchResponse{Error: msg}, status.Error(codes.Internal, msg)
 	}
-	out := make([]*pb.SearchHit, 0, len(hits))
-	for _, h := range hits {
-		out = append(out, &pb.SearchHit{Id: h.ID, Score: h.Score, Metadata: s.openMeta(h.Metadata)})
-	}
+	out := s.openHits(hits)
 	resultCount = len(out)
 	return &pb.SearchResponse{Hits: out}, nil
 }
 
+// openHits converts engine hits to response hits in engine order, opening
+// each one's sealed metadata.
+func (s *ConsoleGRPC) openHits(hits []crypto.SearchHit) []*pb.SearchHit {
+	// One backing array for all response messages instead of an allocation
+	// per hit; out only points into it, so no message value is ever copied.
+	msgs := make([]pb.SearchHit, len(hits))
+	out := make([]*pb.SearchHit, len(hits))
+	for i, h := range hits {
+		m := &msgs[i]
+		m.Id, m.Score, m.Metadata = h.ID, h.Score, s.openMeta(h.Metadata)
+		out[i] = m
+	}
+	return out
+}
+
 // ── GetPermissions (auth query — requirements 4, 8, 12) ───────────
 
 func (s *ConsoleGRPC) GetPermissions(ctx context.Context, req *pb.GetPermissionsRequest) (*pb.GetPermissionsResponse, error) {
-	start := time.Now()
-	user := s.v.tokens.GetUsername(req.GetToken())
-	if user == "" {
-		user = "unknown"
-	}
+	start := s.auditStart()
+	user := "unknown"
 	resultCount := 0
 	statusStr := "success"
 	var errDetail *string
 	defer func() {
-		s.emit(ctx, "get_permissions", user, nil, resultCount, statusStr, errDetail, time.Since(start))
+		s.emit(ctx, "get_permissions", user, nil, resultCount, statusStr, errDetail, start)
 	}()
 
 	username, err := s.v.tokens.Validate(req.GetToken())
+	user = auditUser(username, err)
 	if err != nil {
 		st, msg := mapTokenError(err)
 		statusStr, errDetail = errStatus(err)
 		return &pb.GetPermissionsResponse{Error: msg}, status.Error(st, msg)
 	}
-	user = username
 	key, _, err := s.v.resolveMemberAccess(username)
 	if err != nil {
 		statusStr = "denied"
@@ -920,25 +1013,61 @@ func (s *ConsoleGRPC) sealMeta(token, meta string) (string, error) {
 
 // openMeta best-effort opens a sealed {a,c} envelope to plaintext JSON. On any
 // failure it returns the stored string unchanged (plaintext/legacy tolerated).
+// The agent's cipher comes from the Console cache (metadataCipher), so it is
+// derived once per agent rather than once per hit.
 func (s *ConsoleGRPC) openMeta(stored string) string {
 	if stored == "" {
 		return ""
 	}
+	// A sealed envelope is always a JSON object; anything else (plaintext or
+	// legacy metadata) is returned as-is without a decode attempt whose only
+	// outcome would be the error that says so.
+	if trimmed := strings.TrimLeft(stored, " \t\r\n"); trimmed == "" || trimmed[0] != '{' {
+		return stored
+	}
 	var env envelope
 	if err := json.Unmarshal([]byte(stored), &env); err != nil || env.Cipher == "" {
 		return stored
 	}
-	dek, err := crypto.DeriveAgentKey(s.v.cfg.Tokens.TeamSecret, env.AgentID)
+	c, err := s.v.metadataCipher(env.AgentID)
 	if err != nil {
 		return stored
 	}
-	pt, err := crypto.DecryptMetadata(env.Cipher, dek)
+	pt, err := c.Decrypt(env.Cipher)
 	if err != nil {
 		return stored
 	}
 	return string(pt)
 }
 
+// maxMetaCiphers bounds Console.metaCiphers. Agents are human-scale per
+// team, so in practice the cache never fills; the cap only stops a stream of
+// forged agent IDs from growing it without limit.
+const maxMetaCiphers = 1024
+
+// metadataCipher returns agentID's metadata cipher, deriving and caching it
+// on first use.
+func (v *Console) metadataCipher(agentID string) (*crypto.MetadataCipher, error) {
+	v.metaCiphersMu.Lock()
+	defer v.metaCiphersMu.Unlock()
+	if c, ok := v.metaCiphers[agentID]; ok {
+		return c, nil
+	}
+	dek, err := crypto.DeriveAgentKey(v.cfg.Tokens.TeamSecret, agentID)
+	if err != nil {
+		return nil, err
+	}
+	c, err := crypto.NewMetadataCipher(dek)
+	if err != nil {
+		return nil, err
+	}
+	if v.metaCiphers == nil || len(v.metaCiphers) >= maxMetaCiphers {
+		v.metaCiphers = make(map[string]*crypto.MetadataCipher)
+	}
+	v.metaCiphers[agentID] = c
+	return c, nil
+}
+
 // ── LookupWrap / Unwrap (invite redemption — pre-auth) ────────────
 //
 // The only two RPCs callable WITHOUT a token: the invite code (handle) is the
@@ -948,13 +1077,13 @@ func (s *ConsoleGRPC) openMeta(stored string) string {
 // LookupWrap pre-validates an invite code and returns who/what it is for.
 // Read-only: it never consumes the code and never returns the token.
 func (s *ConsoleGRPC) LookupWrap(ctx context.Context, req *pb.LookupWrapRequest) (*pb.LookupWrapResponse, error) {
-	start := time.Now()
+	start := s.auditStart()
 	user := "unknown"
 	resultCount := 0
 	statusStr := "success"
 	var errDetail *string
 	defer func() {
-		s.emit(ctx, "lookup_wrap", user, nil, resultCount, statusStr, errDetail, time.Since(start))
+		s.emit(ctx, "lookup_wrap", user, nil, resultCount, statusStr, errDetail, start)
 	}()
 
 	if s.v.inviteRedeem == nil {
@@ -994,13 +1123,13 @@ func (s *ConsoleGRPC) LookupWrap(ctx context.Context, req *pb.LookupWrapRequest)
 //     token: the invite is already burned, but "lost invite, re-issue" beats
 //     a token handed out for a member the registry refused to activate.
 func (s *ConsoleGRPC) Unwrap(ctx context.Context, req *pb.UnwrapRequest) (*pb.UnwrapResponse, error) {
-	start := time.Now()
+	start := s.auditStart()
 	user := "unknown"
 	resultCount := 0
 	statusStr := "success"
 	var errDetail *string
 	defer func() {
-		s.emit(ctx, "unwrap", user, nil, resultCount, statusStr, errDetail, time.Since(start))
+		s.emit(ctx, "unwrap", user, nil, resultCount, statusStr, errDetail, start)
 	}()
 
 	if s.v.inviteRedeem == nil || s.v.memberAct == nil {
@@ -1042,6 +1171,20 @@ func (s *ConsoleGRPC) Unwrap(ctx context.Context, req *pb.UnwrapRequest) (*pb.Un
 
 // ── error mapping & audit helpers ────────────────────────────────
 
+// auditUser names the caller for the audit entry from Validate's own result,
+// so handlers need no second token lookup: the user on success, the owner an
+// expired token still names, and "unknown" for a token that matches nobody.
+func auditUser(username string, err error) string {
+	if err == nil {
+		return username
+	}
+	var expired tokens.ErrTokenExpired
+	if errors.As(err, &expired) {
+		return expired.User
+	}
+	return "unknown"
+}
+
 // mapTokenError maps tokens.ErrXxx → (gRPC code, user-facing message). Every
 // token error is an authentication failure; authorization is the group RBAC
 // judge's job and surfaces its own PermissionDenied.
@@ -1090,13 +1233,27 @@ func errStatus(err error) (string, *string) {
 	return "error", &msg
 }
 
-func (s *ConsoleGRPC) emit(ctx context.Context, method, user string, topK *int32, resultCount int, statusStr string, errDetail *string, duration time.Duration) {
+// auditStart stamps an RPC's start for the audit latency. The reading
+// exists only for emit, so none is taken when auditing is off (the logger
+// never turns back on once disabled, so a zero start is never used).
+func (s *ConsoleGRPC) auditStart() time.Time {
+	if !s.v.audit.Enabled() {
+		return time.Time{}
+	}
+	return time.Now()
+}
+
+func (s *ConsoleGRPC) emit(ctx context.Context, method, user string, topK *int32, resultCount int, statusStr string, errDetail *string, start time.Time) {
 	if s.v.audit == nil || !s.v.audit.Enabled() {
 		return
 	}
+	// One clock reading serves both the entry timestamp and the latency;
+	// together with auditStart, none is taken at all when auditing is off.
+	now := time.Now()
+	duration := now.Sub(start)
 	p, _ := peer.FromContext(ctx)
 	s.v.audit.Log(AuditEntry{
-		Timestamp:   nowUTCISO(),
+		Timestamp:   formatUTCISO(now),
 		UserID:      user,
 		Method:      method,
 		TopK:        topK,
@@ -90,7 +90,7 @@ func TestSearchFailOpenNoMembership(t *testing.T) {
 	// exactly the fail-OPEN trigger.
 	_, err := srv.Search(context.Background(), &pb.SearchRequest{
 		Token:  tokens.DemoToken,
-		Vector: []float32{0.1, 0.2},
+		Vector: queryVec(v),
 		TopK:   5,
 	})
 	if err != nil {
@@ -73,7 +73,7 @@ func TestMemberStatusGateOnDataplane(t *testing.T) {
 	ctx := context.Background()
 
 	// Disabled member: denied on Search and Insert, before any engine work.
-	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tokDis.Token, Vector: []float32{0.1, 0.2}, TopK: 5}); status.Code(err) != codes.PermissionDenied || !strings.Contains(err.Error(), "disabled") {
+	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tokDis.Token, Vector: queryVec(v), TopK: 5}); status.Code(err) != codes.PermissionDenied || !strings.Contains(err.Error(), "disabled") {
 		t.Errorf("disabled member Search = %v, want PermissionDenied mentioning disabled", err)
 	}
 	if fake.called {
@@ -84,7 +84,7 @@ func TestMemberStatusGateOnDataplane(t *testing.T) {
 	}
 
 	// Active member: passes the gate on both paths.
-	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tokAct.Token, Vector: []float32{0.1, 0.2}, TopK: 5}); err != nil {
+	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tokAct.Token, Vector: queryVec(v), TopK: 5}); err != nil {
 		t.Errorf("active member Search = %v, want nil", err)
 	}
 	if !fake.called {
@@ -95,7 +95,7 @@ func TestMemberStatusGateOnDataplane(t *testing.T) {
 	}
 
 	// A user with NO member-registry row (the demo/owner token) is not gated.
-	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tokens.DemoToken, Vector: []float32{0.1, 0.2}, TopK: 5}); err != nil {
+	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tokens.DemoToken, Vector: queryVec(v), TopK: 5}); err != nil {
 		t.Errorf("no-registry-row Search = %v, want nil", err)
 	}
 }
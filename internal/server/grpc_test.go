@@ -2,7 +2,11 @@ package server
 
 import (
 	"context"
+	"encoding/json"
 	"errors"
+	"fmt"
+	"os"
+	"path/filepath"
 	"strings"
 	"testing"
 	"time"
@@ -10,6 +14,7 @@ import (
 	"google.golang.org/grpc/codes"
 	"google.golang.org/grpc/status"
 
+	"github.com/CryptoLabInc/rune-console/internal/crypto"
 	"github.com/CryptoLabInc/rune-console/internal/groups"
 	"github.com/CryptoLabInc/rune-console/internal/invites"
 	"github.com/CryptoLabInc/rune-console/internal/members"
@@ -36,6 +41,41 @@ func TestMapTokenErrorCodes(t *testing.T) {
 	}
 }
 
+func TestAuditUserFromValidateResult(t *testing.T) {
+	cases := []struct {
+		username string
+		err      error
+		want     string
+	}{
+		{"alice", nil, "alice"},
+		{"", tokens.ErrTokenExpired{User: "bob"}, "bob"},
+		{"", tokens.ErrTokenNotFound{}, "unknown"},
+	}
+	for _, c := range cases {
+		if got := auditUser(c.username, c.err); got != c.want {
+			t.Errorf("auditUser(%q, %v) = %q, want %q", c.username, c.err, got, c.want)
+		}
+	}
+}
+
+// TestAuditStartSkipsClockWhenAuditOff: the latency stamp is only taken
+// for a logger that will record it.
+func TestAuditStartSkipsClockWhenAuditOff(t *testing.T) {
+	srv := NewConsoleGRPC(newTestConsole(t)) // audit mode ""
+	if got := srv.auditStart(); !got.IsZero() {
+		t.Errorf("auditStart with audit off = %v, want zero", got)
+	}
+	on, err := NewAuditLogger(AuditConfig{Mode: "stdout"})
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer on.Close()
+	srv.v.audit = on
+	if srv.auditStart().IsZero() {
+		t.Error("auditStart with audit on returned zero")
+	}
+}
+
 // ── handler — token error paths (no engine needed; auth runs first) ──
 
 func newTestConsole(t *testing.T) *Console {
@@ -50,41 +90,297 @@ func newTestConsole(t *testing.T) *Console {
 	return NewConsole(cfg, store, groups.NewStore(), nil, audit)
 }
 
-func TestGetAgentManifestInvalidToken(t *testing.T) {
-	srv := NewConsoleGRPC(newTestConsole(t))
-	resp, err := srv.GetAgentManifest(context.Background(), &pb.GetAgentManifestRequest{
-		Token: "evt_ffffffffffffffffffffffffffffffff",
-	})
-	if status.Code(err) != codes.Unauthenticated {
-		t.Errorf("code = %v, want Unauthenticated", status.Code(err))
+// queryVec returns a Search query of v's configured embedding dim.
+func queryVec(v *Console) []float32 { return make([]float32, v.cfg.Keys.EmbeddingDim) }
+
+// TestRPCsRejectInvalidToken covers every token-bearing RPC's auth-first path
+// in one table: an unknown token is Unauthenticated, and the response's error
+// field (where the RPC has one) is populated.
+func TestRPCsRejectInvalidToken(t *testing.T) {
+	const badToken = "evt_ffffffffffffffffffffffffffffffff"
+	v := newTestConsole(t)
+	srv := NewConsoleGRPC(v)
+	cases := map[string]func() (respErr string, err error){
+		"GetAgentManifest": func() (string, error) {
+			resp, err := srv.GetAgentManifest(context.Background(), &pb.GetAgentManifestRequest{Token: badToken})
+			return resp.GetError(), err
+		},
+		"Insert": func() (string, error) {
+			resp, err := srv.Insert(context.Background(), &pb.InsertRequest{
+				Token:    badToken,
+				RmpItem:  []byte{0x01},
+				MmItem:   []byte{0x01},
+				Metadata: `{"x":1}`,
+			})
+			return resp.GetError(), err
+		},
+		"Search": func() (string, error) {
+			resp, err := srv.Search(context.Background(), &pb.SearchRequest{
+				Token:  badToken,
+				Vector: queryVec(v),
+				TopK:   5,
+			})
+			return resp.GetError(), err
+		},
 	}
-	if resp.GetError() == "" {
-		t.Error("response.error is empty")
+	for name, call := range cases {
+		t.Run(name, func(t *testing.T) {
+			respErr, err := call()
+			if status.Code(err) != codes.Unauthenticated {
+				t.Errorf("code = %v, want Unauthenticated", status.Code(err))
+			}
+			if respErr == "" {
+				t.Error("response.error is empty")
+			}
+		})
 	}
 }
 
-func TestInsertInvalidToken(t *testing.T) {
-	srv := NewConsoleGRPC(newTestConsole(t))
-	_, err := srv.Insert(context.Background(), &pb.InsertRequest{
-		Token:    "evt_ffffffffffffffffffffffffffffffff",
-		RmpItem:  []byte{0x01},
-		MmItem:   []byte{0x01},
-		Metadata: `{"x":1}`,
-	})
-	if status.Code(err) != codes.Unauthenticated {
-		t.Errorf("code = %v, want Unauthenticated", status.Code(err))
+// ── Search (handler — fake engine) ─────────────────────────────────
+
+// TestSearchQueuesOnFullSlotsUntilContextEnds: with every search slot taken,
+// a caller waits and gives up with its context's status (Canceled or
+// DeadlineExceeded) without reaching the engine.
+func TestSearchQueuesOnFullSlotsUntilContextEnds(t *testing.T) {
+	cancelled, cancel := context.WithCancel(context.Background())
+	cancel()
+	expired, cancelExpired := context.WithTimeout(context.Background(), time.Millisecond)
+	defer cancelExpired()
+	cases := map[string]struct {
+		ctx  context.Context
+		want codes.Code
+	}{
+		"cancelled": {cancelled, codes.Canceled},
+		"deadline":  {expired, codes.DeadlineExceeded},
+	}
+	for name, tc := range cases {
+		t.Run(name, func(t *testing.T) {
+			v := newTestConsole(t)
+			fake := &fakeEngine{}
+			v.engine = fake
+			v.searchSlots = make(chan struct{}, 1)
+			v.searchSlots <- struct{}{} // the one slot is busy
+			srv := NewConsoleGRPC(v)
+
+			_, err := srv.Search(tc.ctx, &pb.SearchRequest{
+				Token:  tokens.DemoToken,
+				Vector: queryVec(v),
+				TopK:   5,
+			})
+			if status.Code(err) != tc.want {
+				t.Fatalf("code = %v, want %v", status.Code(err), tc.want)
+			}
+			if fake.called {
+				t.Fatal("engine.Search was called without a free slot")
+			}
+		})
 	}
 }
 
-func TestSearchInvalidToken(t *testing.T) {
-	srv := NewConsoleGRPC(newTestConsole(t))
-	_, err := srv.Search(context.Background(), &pb.SearchRequest{
-		Token:  "evt_ffffffffffffffffffffffffffffffff",
-		Vector: []float32{0.1, 0.2},
-		TopK:   5,
+// TestSearchRejectsWrongDimension: a query whose length is not the configured
+// embedding dim is refused before it reaches the engine — and before token
+// validation, so an unauthenticated one gets InvalidArgument too.
+func TestSearchRejectsWrongDimension(t *testing.T) {
+	const badToken = "evt_ffffffffffffffffffffffffffffffff"
+	for _, token := range []string{tokens.DemoToken, badToken} {
+		for name, delta := range map[string]int{"short": -1, "long": +1} {
+			t.Run(fmt.Sprintf("%s/%s", name, token[:8]), func(t *testing.T) {
+				v := newTestConsole(t)
+				fake := &fakeEngine{}
+				v.engine = fake
+				srv := NewConsoleGRPC(v)
+
+				dim := v.cfg.Keys.EmbeddingDim
+				_, err := srv.Search(context.Background(), &pb.SearchRequest{
+					Token:  token,
+					Vector: make([]float32, dim+delta),
+					TopK:   5,
+				})
+				if status.Code(err) != codes.InvalidArgument {
+					t.Fatalf("code = %v, want InvalidArgument", status.Code(err))
+				}
+				if fake.called {
+					t.Fatal("engine.Search was called for a wrong-dimension query")
+				}
+			})
+		}
+	}
+}
+
+// TestSearchReleasesSlot: a completed Search hands its slot back, so a
+// single-slot console serves calls back to back.
+func TestSearchReleasesSlot(t *testing.T) {
+	v := newTestConsole(t)
+	v.engine = &fakeEngine{}
+	v.searchSlots = make(chan struct{}, 1)
+	srv := NewConsoleGRPC(v)
+	for i := 0; i < 2; i++ {
+		ctx, cancel := context.WithTimeout(context.Background(), time.Second)
+		_, err := srv.Search(ctx, &pb.SearchRequest{
+			Token:  tokens.DemoToken,
+			Vector: queryVec(v),
+			TopK:   5,
+		})
+		cancel()
+		if err != nil {
+			t.Fatalf("search %d: %v", i, err)
+		}
+	}
+}
+
+// ── manifest + metadata helpers (key cache, envelope opening) ─────
+
+// TestGetAgentManifestEncodingMatchesMapForm pins the manifest bytes to what
+// the former map[string]any encoding produced (sorted keys, same values):
+// rune-mcp parses this document, so the typed struct must not change it.
+func TestGetAgentManifestEncodingMatchesMapForm(t *testing.T) {
+	v := newTestConsole(t)
+	keyDir := filepath.Join(v.cfg.Keys.Path, v.bundleParams.KeyID)
+	for _, tier := range []string{"rmp", "mm"} {
+		if err := os.MkdirAll(filepath.Join(keyDir, tier), 0o700); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(filepath.Join(keyDir, tier, "EncKey.json"), []byte(`{"tier":"`+tier+`"}`), 0o600); err != nil {
+			t.Fatal(err)
+		}
+	}
+	for name, eng := range map[string]consoleEngine{"no engine": nil, "engine": &fakeEngine{}} {
+		t.Run(name, func(t *testing.T) {
+			v.ConnectEngine(eng)
+			resp, err := NewConsoleGRPC(v).GetAgentManifest(context.Background(), &pb.GetAgentManifestRequest{Token: tokens.DemoToken})
+			if err != nil {
+				t.Fatal(err)
+			}
+			var asMap map[string]any
+			if err := json.Unmarshal([]byte(resp.GetManifestJson()), &asMap); err != nil {
+				t.Fatal(err)
+			}
+			want, err := json.Marshal(asMap)
+			if err != nil {
+				t.Fatal(err)
+			}
+			if resp.GetManifestJson() != string(want) {
+				t.Errorf("manifest = %s\nwant map form %s", resp.GetManifestJson(), want)
+			}
+			_, hasVersion := asMap["centroid_set_version"]
+			if hasVersion != (eng != nil) {
+				t.Errorf("centroid_set_version present = %v, want %v", hasVersion, eng != nil)
+			}
+		})
+	}
+}
+
+// TestLoadEncKeysCachesAfterFirstSuccess: a missing key set is retried on the
+// next call, and once read the envelopes are served from memory.
+func TestLoadEncKeysCachesAfterFirstSuccess(t *testing.T) {
+	v := newTestConsole(t)
+	if _, err := v.loadEncKeys(); err == nil {
+		t.Fatal("loadEncKeys succeeded with no key files")
+	}
+	keyDir := filepath.Join(v.cfg.Keys.Path, v.bundleParams.KeyID)
+	for _, tier := range []string{"rmp", "mm"} {
+		if err := os.MkdirAll(filepath.Join(keyDir, tier), 0o700); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(filepath.Join(keyDir, tier, "EncKey.json"), []byte(tier), 0o600); err != nil {
+			t.Fatal(err)
+		}
+	}
+	if _, err := v.loadEncKeys(); err != nil {
+		t.Fatalf("loadEncKeys after keys appeared: %v", err)
+	}
+	if err := os.RemoveAll(keyDir); err != nil {
+		t.Fatal(err)
+	}
+	keys, err := v.loadEncKeys()
+	if err != nil {
+		t.Fatalf("cached loadEncKeys: %v", err)
+	}
+	if string(keys.rmp) != `"rmp"` || string(keys.mm) != `"mm"` {
+		t.Errorf("keys = %s/%s, want encoded rmp/mm", keys.rmp, keys.mm)
+	}
+}
+
+// TestMetadataCipherCachedAcrossCalls: an agent's cipher is derived once and
+// then served from the Console cache, which resets instead of growing past
+// maxMetaCiphers.
+func TestMetadataCipherCachedAcrossCalls(t *testing.T) {
+	v := newTestConsole(t)
+	first, err := v.metadataCipher("agent-1")
+	if err != nil {
+		t.Fatal(err)
+	}
+	again, err := v.metadataCipher("agent-1")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if first != again {
+		t.Error("second lookup derived a new cipher")
+	}
+	for i := 0; i < maxMetaCiphers; i++ {
+		if _, err := v.metadataCipher(fmt.Sprintf("agent-%d", i+2)); err != nil {
+			t.Fatal(err)
+		}
+	}
+	if n := len(v.metaCiphers); n > maxMetaCiphers {
+		t.Errorf("cache holds %d ciphers, want at most %d", n, maxMetaCiphers)
+	}
+}
+
+// TestOpenMetaEnvelopeAndPassthrough: a sealed {a,c} envelope opens to its
+// plaintext; plaintext, legacy and malformed values come back unchanged.
+func TestOpenMetaEnvelopeAndPassthrough(t *testing.T) {
+	v := newTestConsole(t)
+	srv := NewConsoleGRPC(v)
+	const agentID = "agent-1"
+	sealed, err := json.Marshal(envelope{
+		AgentID: agentID,
+		Cipher:  mustEncrypt(t, []byte(`{"title":"t"}`), mustDEK(t, v.cfg.Tokens.TeamSecret, agentID)),
 	})
-	if status.Code(err) != codes.Unauthenticated {
-		t.Errorf("code = %v, want Unauthenticated", status.Code(err))
+	if err != nil {
+		t.Fatal(err)
+	}
+	cases := map[string]struct{ stored, want string }{
+		"sealed":         {string(sealed), `{"title":"t"}`},
+		"empty":          {"", ""},
+		"plaintext":      {"just text", "just text"},
+		"legacy object":  {`{"x":1}`, `{"x":1}`},
+		"bad ciphertext": {`{"a":"agent-1","c":"!!"}`, `{"a":"agent-1","c":"!!"}`},
+	}
+	for name, c := range cases {
+		if got := srv.openMeta(c.stored); got != c.want {
+			t.Errorf("%s: openMeta = %q, want %q", name, got, c.want)
+		}
+	}
+}
+
+// TestOpenHitsPreservesOrder: hits from interleaved agents are each opened
+// under their own agent's key, in engine order, with one cipher per agent.
+func TestOpenHitsPreservesOrder(t *testing.T) {
+	v := newTestConsole(t)
+	srv := NewConsoleGRPC(v)
+	agents := []string{"agent-1", "agent-2", "agent-3"}
+	hits := make([]crypto.SearchHit, 7)
+	for i := range hits {
+		agentID := agents[i%len(agents)]
+		dek := mustDEK(t, v.cfg.Tokens.TeamSecret, agentID)
+		sealed, err := json.Marshal(envelope{AgentID: agentID, Cipher: mustEncrypt(t, []byte(fmt.Sprintf(`{"n":%d}`, i)), dek)})
+		if err != nil {
+			t.Fatal(err)
+		}
+		hits[i] = crypto.SearchHit{ID: fmt.Sprint(i), Score: float64(i), Metadata: string(sealed)}
+	}
+	out := srv.openHits(hits)
+	if len(out) != len(hits) {
+		t.Fatalf("len = %d, want %d", len(out), len(hits))
+	}
+	for i, h := range out {
+		if h.GetId() != fmt.Sprint(i) || h.GetMetadata() != fmt.Sprintf(`{"n":%d}`, i) {
+			t.Fatalf("hit %d = {%s %q}, want {%d {\"n\":%d}}", i, h.GetId(), h.GetMetadata(), i, i)
+		}
+	}
+	if n := len(v.metaCiphers); n != len(agents) {
+		t.Errorf("derived %d ciphers for %d agents, want one each", n, len(agents))
 	}
 }
 
@@ -12,6 +12,7 @@ import (
 	"google.golang.org/grpc/codes"
 	"google.golang.org/grpc/status"
 	"google.golang.org/protobuf/proto"
+	"google.golang.org/protobuf/reflect/protoregistry"
 
 	pb "github.com/CryptoLabInc/rune-console/pkg/consolepb"
 )
@@ -44,7 +45,13 @@ var engineRequiredMethods = map[string]bool{
 // redemption) stay callable during bootstrap. Validation errors are
 // InvalidArgument. Health/reflection bypass everything.
 func NewValidationInterceptor(engineReady func() bool) (grpc.UnaryServerInterceptor, error) {
-	v, err := protovalidate.New()
+	// Compile every unary ConsoleService request's rules up front so the first
+	// RPC of each kind does not pay the CEL compilation on the request path.
+	msgs, err := unaryRequestMessages()
+	if err != nil {
+		return nil, fmt.Errorf("interceptors: %w", err)
+	}
+	v, err := protovalidate.New(protovalidate.WithMessages(msgs...))
 	if err != nil {
 		return nil, fmt.Errorf("interceptors: new protovalidate: %w", err)
 	}
@@ -67,6 +74,30 @@ func NewValidationInterceptor(engineReady func() bool) (grpc.UnaryServerIntercep
 	}, nil
 }
 
+// unaryRequestMessages returns one instance of every unary ConsoleService
+// request type, read off the service descriptor so a new RPC is covered
+// without touching this file. Streaming RPCs are skipped: only the unary
+// interceptor validates.
+func unaryRequestMessages() ([]proto.Message, error) {
+	var out []proto.Message
+	svcs := pb.File_console_service_proto.Services()
+	for i := 0; i < svcs.Len(); i++ {
+		methods := svcs.Get(i).Methods()
+		for j := 0; j < methods.Len(); j++ {
+			md := methods.Get(j)
+			if md.IsStreamingClient() || md.IsStreamingServer() {
+				continue
+			}
+			mt, err := protoregistry.GlobalTypes.FindMessageByName(md.Input().FullName())
+			if err != nil {
+				return nil, fmt.Errorf("request type of %s: %w", md.FullName(), err)
+			}
+			out = append(out, mt.New().Interface())
+		}
+	}
+	return out, nil
+}
+
 // runtimeCheckToken pulls the token field from a Console request and runs
 // the supplementary checks the .proto annotations cannot express.
 func runtimeCheckToken(req any) error {
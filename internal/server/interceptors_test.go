@@ -133,3 +133,33 @@ func TestInterceptorAllowsNonConsoleMethod(t *testing.T) {
 		t.Errorf("non-console method blocked: %v", err)
 	}
 }
+
+// TestUnaryRequestMessagesCoverService: the precompiled set is exactly the
+// unary RPCs' request types; the server-streaming GetCentroids never reaches
+// the unary interceptor.
+func TestUnaryRequestMessagesCoverService(t *testing.T) {
+	msgs, err := unaryRequestMessages()
+	if err != nil {
+		t.Fatal(err)
+	}
+	got := map[string]bool{}
+	for _, m := range msgs {
+		got[string(m.ProtoReflect().Descriptor().Name())] = true
+	}
+	want := []string{
+		"GetAgentManifestRequest", "GetCACertRequest", "InsertRequest",
+		"SearchRequest", "GetPermissionsRequest", "LookupWrapRequest",
+		"UnwrapRequest", "ReportActivationRequest",
+	}
+	for _, name := range want {
+		if !got[name] {
+			t.Errorf("%s missing from the precompiled set", name)
+		}
+	}
+	if got["GetCentroidsRequest"] {
+		t.Error("streaming GetCentroidsRequest precompiled for the unary interceptor")
+	}
+	if len(got) != len(want) {
+		t.Errorf("precompiled %d request types, want %d", len(got), len(want))
+	}
+}
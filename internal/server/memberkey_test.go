@@ -118,7 +118,7 @@ func TestDataplaneResolvesEmailToMemberUUID(t *testing.T) {
 	srv := NewConsoleGRPC(v)
 	ctx := context.Background()
 
-	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tok.Token, Vector: []float32{0.1, 0.2}, TopK: 5}); err != nil {
+	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tok.Token, Vector: queryVec(v), TopK: 5}); err != nil {
 		t.Fatalf("Search = %v, want nil", err)
 	}
 	if len(fake.gotScope) != 1 || fake.gotScope[0] != g.ID {
@@ -142,7 +142,7 @@ func TestDataplaneNoMemberRowFailsClosed(t *testing.T) {
 	srv := NewConsoleGRPC(v)
 	ctx := context.Background()
 
-	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tokens.DemoToken, Vector: []float32{0.1, 0.2}, TopK: 5}); err != nil {
+	if _, err := srv.Search(ctx, &pb.SearchRequest{Token: tokens.DemoToken, Vector: queryVec(v), TopK: 5}); err != nil {
 		t.Fatalf("Search = %v, want nil", err)
 	}
 	if len(fake.gotScope) != 1 || fake.gotScope[0] != publicOnlyScopeSentinel {
@@ -190,7 +190,7 @@ func TestDataplaneRejectsMemberIDAsTokenIdentity(t *testing.T) {
 	ctx := context.Background()
 
 	// Search must be denied — never handed Alice's scope.
-	_, err = srv.Search(ctx, &pb.SearchRequest{Token: tok.Token, Vector: []float32{0.1, 0.2}, TopK: 5})
+	_, err = srv.Search(ctx, &pb.SearchRequest{Token: tok.Token, Vector: queryVec(v), TopK: 5})
 	if status.Code(err) != codes.PermissionDenied {
 		t.Fatalf("Search with member-UUID token identity code = %v, want PermissionDenied", status.Code(err))
 	}
@@ -18,6 +18,7 @@ import (
 	"google.golang.org/grpc/credentials"
 	"google.golang.org/grpc/health"
 	healthpb "google.golang.org/grpc/health/grpc_health_v1"
+	"google.golang.org/grpc/keepalive"
 	"google.golang.org/grpc/reflection"
 
 	pb "github.com/CryptoLabInc/rune-console/pkg/consolepb"
@@ -36,7 +37,7 @@ func Serve(ctx context.Context, v *Console, consoleHandler http.Handler) error {
 	// startup; no separate cloud-setup step is needed.
 
 	// gRPC listener
-	grpcAddr := fmt.Sprintf("%s:%d", grpcHost(cfg), cfg.Server.GRPC.Port)
+	grpcAddr := cfg.GRPCAddr()
 	grpcLis, err := net.Listen("tcp", grpcAddr)
 	if err != nil {
 		return fmt.Errorf("server: listen %s: %w", grpcAddr, err)
@@ -58,6 +59,19 @@ func Serve(ctx context.Context, v *Console, consoleHandler http.Handler) error {
 		grpc.MaxSendMsgSize(MaxMessageSize),
 		grpc.UnaryInterceptor(interceptor),
 		grpc.Creds(tlsCreds),
+		// Agents hold one long-lived channel each. Probe idle transports so a
+		// peer that vanished (laptop sleep, NAT drop) is reaped in about a
+		// minute rather than the 2h default, and accept client pings down to
+		// 10s so an agent's own keepalive never earns a GOAWAY. Flow-control
+		// windows are left alone: setting them disables BDP auto-tuning.
+		grpc.KeepaliveParams(keepalive.ServerParameters{
+			Time:    time.Minute,
+			Timeout: 20 * time.Second,
+		}),
+		grpc.KeepaliveEnforcementPolicy(keepalive.EnforcementPolicy{
+			MinTime:             10 * time.Second,
+			PermitWithoutStream: true,
+		}),
 	}
 	gs := grpc.NewServer(opts...)
 	pb.RegisterConsoleServiceServer(gs, NewConsoleGRPC(v))
@@ -3,10 +3,11 @@ package tokens
 import (
 	"context"
 	"crypto/rand"
+	"crypto/sha256"
 	"database/sql"
 	"encoding/hex"
 	"fmt"
-	"os"
+	"log/slog"
 	"sort"
 	"sync"
 	"time"
@@ -24,8 +25,8 @@ import (
 // a pure in-memory registry — how unit tests use it.
 type Store struct {
 	mu           sync.RWMutex
-	tokens       map[string]*Token // keyed by token string
-	tokensByUser map[string]*Token // keyed by username
+	tokens       map[tokenDigest]*Token // keyed by SHA-256 of the token string (see digestOf)
+	tokensByUser map[string]*Token      // keyed by username
 
 	// db is the optional write-through persistence sink (the unified store
 	// database, attached by LoadFromDB). nil = pure in-memory store.
@@ -38,12 +39,21 @@ type Store struct {
 	now func() time.Time
 }
 
+// tokenDigest is the token index key. Keying by a digest instead of the
+// secret means the map's hash-and-compare work (whose timing varies with how
+// much of the key matches) only ever runs against SHA-256 outputs, so probe
+// timing reveals nothing about a real token's bytes; the fixed-size array key
+// is also cheaper to hash than a variable-length string.
+type tokenDigest [sha256.Size]byte
+
+func digestOf(tokenStr string) tokenDigest { return sha256.Sum256([]byte(tokenStr)) }
+
 // NewStore returns an empty in-memory token registry with the real UTC
 // clock. Persistence is attached separately (LoadFromDB); without it every
 // mutation stays in memory only.
 func NewStore() *Store {
 	return &Store{
-		tokens:       make(map[string]*Token),
+		tokens:       make(map[tokenDigest]*Token),
 		tokensByUser: make(map[string]*Token),
 		now:          func() time.Time { return time.Now().UTC() },
 	}
@@ -58,7 +68,7 @@ func NewStore() *Store {
 func (s *Store) LoadFromDB(database *sql.DB) error {
 	ctx := context.Background()
 
-	byToken := make(map[string]*Token)
+	byToken := make(map[tokenDigest]*Token)
 	byUser := make(map[string]*Token)
 	tokRows, err := database.QueryContext(ctx,
 		`SELECT user, token, issued_at, expires, last_used, activated_at FROM tokens`)
@@ -78,7 +88,7 @@ func (s *Store) LoadFromDB(database *sql.DB) error {
 		// ONE shared *Token per row, same aliasing as AddToken: mutators
 		// update the shared record and both indexes see it.
 		cp := t
-		byToken[cp.Token] = &cp
+		byToken[digestOf(cp.Token)] = &cp
 		byUser[cp.User] = &cp
 	}
 	if err := tokRows.Err(); err != nil {
@@ -108,7 +118,7 @@ func (s *Store) LoadDefaultsWithDemoToken() {
 		Token:    DemoToken,
 		IssuedAt: s.now().Format(dateFormat),
 	}
-	s.tokens[tok.Token] = tok
+	s.tokens[digestOf(tok.Token)] = tok
 	s.tokensByUser[tok.User] = tok
 }
 
@@ -116,9 +126,34 @@ func (s *Store) LoadDefaultsWithDemoToken() {
 // per-RPC hot path: lookup → expiry → last-used stamp, all against the
 // in-memory maps with ZERO synchronous SQL. Authorization is the group RBAC
 // judge's job; the token itself carries only identity.
+//
+// Inside a token's throttle window Validate writes nothing, so that case is
+// served under the read lock and concurrent RPCs don't serialize on the
+// store; only a due stamp (or a not-yet-parsed one) takes the write lock,
+// which re-checks everything from scratch.
 func (s *Store) Validate(tokenStr string) (string, error) {
+	key := digestOf(tokenStr)
+	s.mu.RLock()
+	tok, ok := s.tokens[key]
+	if !ok {
+		s.mu.RUnlock()
+		return "", ErrTokenNotFound{}
+	}
+	now := s.now()
+	if tok.IsExpiredAt(now) {
+		user := tok.User
+		s.mu.RUnlock()
+		return "", ErrTokenExpired{User: user}
+	}
+	if !tok.lastUsedAt.IsZero() && now.Sub(tok.lastUsedAt) < lastUsedThrottle {
+		user := tok.User
+		s.mu.RUnlock()
+		return user, nil
+	}
+	s.mu.RUnlock()
+
 	s.mu.Lock()
-	tok, ok := s.tokens[tokenStr]
+	tok, ok = s.tokens[key]
 	if !ok {
 		s.mu.Unlock()
 		return "", ErrTokenNotFound{}
@@ -161,29 +196,24 @@ const lastUsedThrottle = 10 * time.Second
 // has elapsed since the previous stamp, returning the stamp time and whether
 // it changed (so the caller enqueues the async DB write). The stamp is the
 // canonical storedb.TimeFormat rendering; the prev-parse stays the plain
-// RFC3339 layout, which consumes the fractional seconds. Caller holds s.mu.
+// RFC3339 layout, which consumes the fractional seconds, and runs once per
+// token — later checks reuse the cached tok.lastUsedAt. Caller holds s.mu.
 func (s *Store) stampLastUsedLocked(tok *Token) (time.Time, bool) {
 	now := s.now()
-	if tok.LastUsed != "" {
-		if prev, err := time.Parse(time.RFC3339, tok.LastUsed); err == nil && now.Sub(prev) < lastUsedThrottle {
-			return time.Time{}, false
+	if tok.LastUsed != "" && tok.lastUsedAt.IsZero() {
+		// First check since load: parse the persisted stamp once and keep it.
+		if prev, err := time.Parse(time.RFC3339, tok.LastUsed); err == nil {
+			tok.lastUsedAt = prev
 		}
 	}
+	if !tok.lastUsedAt.IsZero() && now.Sub(tok.lastUsedAt) < lastUsedThrottle {
+		return time.Time{}, false
+	}
 	tok.LastUsed = storedb.FormatTime(now)
+	tok.lastUsedAt = now
 	return now, true
 }
 
-// GetUsername returns the user a token string belongs to, or "" when the
-// token is unknown — best-effort audit attribution, never an auth decision.
-func (s *Store) GetUsername(tokenStr string) string {
-	s.mu.RLock()
-	defer s.mu.RUnlock()
-	if tok, ok := s.tokens[tokenStr]; ok {
-		return tok.User
-	}
-	return ""
-}
-
 // MarkActivated stamps the user's token activated_at to now: the agent has
 // self-reported reaching terminal active (ReportActivation) — fully configured
 // and serving, not merely authenticated. This is the signal that advances a
@@ -243,7 +273,7 @@ func (s *Store) AddToken(user string, expiresDays *int) (*Token, error) {
 	}); err != nil {
 		return nil, err
 	}
-	s.tokens[tok.Token] = tok
+	s.tokens[digestOf(tok.Token)] = tok
 	s.tokensByUser[tok.User] = tok
 	out := *tok
 	return &out, nil
@@ -273,7 +303,7 @@ func (s *Store) RevokeToken(user string) (bool, error) {
 		return false, fmt.Errorf("tokens: revoke for user %q: %w", user, err)
 	}
 	delete(s.tokensByUser, user)
-	delete(s.tokens, tok.Token)
+	delete(s.tokens, digestOf(tok.Token))
 	return true, nil
 }
 
@@ -320,8 +350,8 @@ func (s *Store) RotateToken(user string) (*Token, error) {
 	}); err != nil {
 		return nil, err
 	}
-	delete(s.tokens, old.Token)
-	s.tokens[newTok.Token] = newTok
+	delete(s.tokens, digestOf(old.Token))
+	s.tokens[digestOf(newTok.Token)] = newTok
 	s.tokensByUser[user] = newTok
 	out := *newTok
 	return &out, nil
@@ -449,7 +479,7 @@ func (s *Store) runLastUsedWriter(queue <-chan lastUsedEvent) {
 		}
 		if _, err := s.db.ExecContext(context.Background(),
 			`UPDATE tokens SET last_used = ? WHERE user = ? AND token = ?`, ev.stamp, ev.user, ev.token); err != nil {
-			fmt.Fprintf(os.Stderr, "tokens: persist last_used for user '%s' failed: %v\n", ev.user, err)
+			slog.Warn("tokens: persist last_used failed", "user", ev.user, "err", err)
 			continue
 		}
 		lastPersisted[ev.user] = ev.at
@@ -184,20 +184,6 @@ func TestListTokensHidesValues(t *testing.T) {
 	// TokenInfo struct intentionally has no Token field.
 }
 
-func TestGetUsername(t *testing.T) {
-	s, _ := newTestStore(t)
-	tok, err := s.AddToken("alice", nil)
-	if err != nil {
-		t.Fatal(err)
-	}
-	if got := s.GetUsername(tok.Token); got != "alice" {
-		t.Errorf("GetUsername = %q, want alice", got)
-	}
-	if got := s.GetUsername("evt_00000000000000000000000000000000"); got != "" {
-		t.Errorf("GetUsername(unknown) = %q, want empty", got)
-	}
-}
-
 func TestNeverExpiresToken(t *testing.T) {
 	s, database := newTestStore(t)
 	tok, err := s.AddToken("permanent_user", nil)
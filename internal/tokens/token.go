@@ -9,6 +9,10 @@ type Token struct {
 	Expires     string `yaml:"expires,omitempty"`      // ISO date, empty = never
 	LastUsed    string `yaml:"last_used,omitempty"`    // RFC3339 UTC; stamped on Validate (throttled), empty = never used
 	ActivatedAt string `yaml:"activated_at,omitempty"` // RFC3339 UTC; set on ReportActivation (agent reached active), empty = never activated
+
+	// lastUsedAt is LastUsed already parsed, so the per-RPC throttle check
+	// compares times instead of re-parsing the string. Zero = not yet parsed.
+	lastUsedAt time.Time
 }
 
 const dateFormat = "2006-01-02"
@@ -3,6 +3,7 @@ package updater
 import (
 	"archive/tar"
 	"bufio"
+	"bytes"
 	"crypto/sha256"
 	"encoding/hex"
 	"encoding/json"
@@ -307,24 +308,25 @@ func validateManagedRoot(root string) error {
 	if err != nil || string(content) != ManagedRootMarkerContent {
 		return errors.New("configured managed root has an invalid ownership marker")
 	}
-	if err := filepath.WalkDir(root, func(path string, entry fs.DirEntry, walkErr error) error {
-		if walkErr != nil {
-			return walkErr
-		}
-		if path != root && entry.Type()&os.ModeSymlink != 0 {
-			return errors.New("managed root contains a nested symlink")
-		}
-		return nil
-	}); err != nil {
-		return errors.New("configured managed root contains an unsafe entry")
-	}
-	if err := validateNoMountBoundaries(root); err != nil {
-		return err
-	}
-	return nil
+	// The nested-symlink check rides on the mount-boundary walk so a large
+	// managed root is traversed once rather than twice.
+	return checkMountBoundaries(root, true)
 }
 
+// errNestedBoundary marks an entry on another device found during the
+// mount-boundary walk. Any other walk failure (a nested symlink when those
+// are rejected, an unreadable entry) is told apart from it so the caller
+// reports it as the refusal it is rather than as a mount boundary.
+var errNestedBoundary = errors.New("managed root contains a nested filesystem boundary")
+
 func validateNoMountBoundaries(root string) error {
+	return checkMountBoundaries(root, false)
+}
+
+// checkMountBoundaries refuses a root that is, or contains, a filesystem
+// boundary. With rejectSymlinks set, the same single walk also refuses any
+// symlink below the root.
+func checkMountBoundaries(root string, rejectSymlinks bool) error {
 	rootInfo, err := os.Stat(root)
 	if err != nil || !rootInfo.IsDir() {
 		return errors.New("managed root is not an inspectable directory")
@@ -345,21 +347,30 @@ func validateNoMountBoundaries(root string) error {
 	if !ok || uint64(parentStat.Dev) != uint64(rootStat.Dev) {
 		return errors.New("managed root must not be a filesystem mount point")
 	}
-	if err := filepath.WalkDir(root, func(_ string, entry fs.DirEntry, walkErr error) error {
+	if err := filepath.WalkDir(root, func(path string, entry fs.DirEntry, walkErr error) error {
 		if walkErr != nil {
 			return walkErr
 		}
+		if rejectSymlinks && path != root && entry.Type()&os.ModeSymlink != 0 {
+			return errors.New("managed root contains a nested symlink")
+		}
 		info, err := entry.Info()
 		if err != nil {
 			return err
 		}
 		stat, ok := info.Sys().(*syscall.Stat_t)
 		if !ok || uint64(stat.Dev) != uint64(rootStat.Dev) {
-			return errors.New("managed root contains a nested filesystem boundary")
+			return errNestedBoundary
 		}
 		return nil
 	}); err != nil {
-		return errors.New("managed root contains a nested filesystem boundary")
+		// With symlinks rejected this walk is also the managed-root entry
+		// check, whose failures (a symlink, an uninspectable entry) are the
+		// "unsafe entry" refusal; only a real device change is a boundary.
+		if rejectSymlinks && !errors.Is(err, errNestedBoundary) {
+			return errors.New("configured managed root contains an unsafe entry")
+		}
+		return errNestedBoundary
 	}
 	if runtime.GOOS != "linux" {
 		return nil
@@ -1050,14 +1061,24 @@ func sameRegularFile(a, b string) bool {
 		return false
 	}
 	defer bFile.Close()
-	aHash, bHash := sha256.New(), sha256.New()
-	if _, err := io.Copy(aHash, aFile); err != nil {
-		return false
-	}
-	if _, err := io.Copy(bHash, bFile); err != nil {
-		return false
+	// Sizes already match, so compare the two streams block by block and stop
+	// at the first difference instead of hashing both files end to end.
+	aBuf, bBuf := make([]byte, 64<<10), make([]byte, 64<<10)
+	for {
+		aN, aErr := io.ReadFull(aFile, aBuf)
+		bN, bErr := io.ReadFull(bFile, bBuf)
+		if aN != bN || !bytes.Equal(aBuf[:aN], bBuf[:bN]) {
+			return false
+		}
+		aEOF := aErr == io.EOF || aErr == io.ErrUnexpectedEOF
+		bEOF := bErr == io.EOF || bErr == io.ErrUnexpectedEOF
+		if aEOF || bEOF {
+			return aEOF && bEOF
+		}
+		if aErr != nil || bErr != nil {
+			return false
+		}
 	}
-	return string(aHash.Sum(nil)) == string(bHash.Sum(nil))
 }
 
 func cleanupStagedEntries(staged []stagedEntry) error {
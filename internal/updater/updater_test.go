@@ -349,6 +349,27 @@ func TestManagedRootRequiresOwnedMarkerAndRejectsNestedSymlink(t *testing.T) {
 	}
 }
 
+// TestManagedRootUninspectableEntryIsUnsafe: a walk failure inside a managed
+// root is the "unsafe entry" refusal, not a mount boundary.
+func TestManagedRootUninspectableEntryIsUnsafe(t *testing.T) {
+	if os.Geteuid() == 0 {
+		t.Skip("root reads mode-0 directories; cannot provoke a walk error")
+	}
+	root := t.TempDir()
+	locked := filepath.Join(root, "locked")
+	if err := os.MkdirAll(filepath.Join(locked, "inner"), 0o700); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Chmod(locked, 0); err != nil {
+		t.Fatal(err)
+	}
+	t.Cleanup(func() { _ = os.Chmod(locked, 0o700) })
+	err := checkMountBoundaries(root, true)
+	if err == nil || !strings.Contains(err.Error(), "unsafe entry") {
+		t.Fatalf("uninspectable entry error = %v, want unsafe entry", err)
+	}
+}
+
 func TestParseLinuxMountInfoUnescapesMountPoints(t *testing.T) {
 	t.Parallel()
 	input := strings.Join([]string{